@@ -1,19 +1,159 @@
 # flappy_ai.py
 # NEAT runner that imports core game pieces from flappy_core.
-# Exposes run_ai(config_path, surface, max_gens=50)
+# Exposes run_ai(config_path, surface, max_gens=50), run_headless(config_path,
+# max_gens=50, seed=None) for sweeps, and the compiled champion
+# helpers compile_genome / save_champion / load_champion / make_pilot.
+# bird_inputs builds the network inputs for both training and the pilot.
 
 import neat
 import os
+import json
+import random
 import pygame
+from neat.graphs import feed_forward_layers
+from neat.activations import ActivationFunctionSet
+from neat.aggregations import AggregationFunctionSet
 from flappy_core import Bird, Pipe, Base, draw_ai_window, WIN_WIDTH
 import time
 
 GEN = 0
 
+# best genome of all AI runs so far, compiled (see compile_genome)
+CHAMPION_FILE = "champion.json"
+
+# --- Compiled champion ---
+class CompiledNet:
+    """
+    Minimal feed-forward evaluator for a single genome.
+    Node values live in one preallocated list indexed by slot (inputs first),
+    so activate() does no per-call list/dict building; the returned output
+    list is reused between calls.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        activations = ActivationFunctionSet()
+        aggregations = AggregationFunctionSet()
+        self.num_inputs = spec['num_inputs']
+        self._values = [0.0] * spec['num_slots']
+        self._nodes = []
+        for n in spec['nodes']:
+            # None marks plain sum aggregation, which is done inline
+            agg = None if n['aggregation'] == 'sum' else aggregations.get(n['aggregation'])
+            links = tuple((src, w) for src, w in n['links'])
+            self._nodes.append((n['slot'], activations.get(n['activation']), agg,
+                                n['bias'], n['response'], links))
+        self._nodes = tuple(self._nodes)
+        self._output_slots = tuple(spec['outputs'])
+        self._outputs = [0.0] * len(self._output_slots)
+
+    def activate(self, inputs):
+        values = self._values
+        if len(inputs) != self.num_inputs:
+            raise RuntimeError(f"Expected {self.num_inputs} inputs, got {len(inputs)}")
+        for i in range(self.num_inputs):
+            values[i] = inputs[i]
+        for slot, act, agg, bias, response, links in self._nodes:
+            if agg is None:
+                total = 0.0
+                for src, w in links:
+                    total += values[src] * w
+            else:
+                total = agg([values[src] * w for src, w in links])
+            values[slot] = act(bias + response * total)
+        outputs = self._outputs
+        for i, slot in enumerate(self._output_slots):
+            outputs[i] = values[slot]
+        return outputs
+
+def compile_genome(genome, config):
+    """
+    Flatten a genome into a CompiledNet spec. Disabled connections, nodes that
+    can't reach an output and connections from nodes that are never evaluated
+    (which would always contribute 0) are dropped. Evaluation matches
+    neat.nn.FeedForwardNetwork for the same genome.
+    """
+    gconf = config.genome_config
+    connections = [cg.key for cg in genome.connections.values() if cg.enabled]
+    layers = feed_forward_layers(gconf.input_keys, gconf.output_keys, connections)
+
+    slots = {key: i for i, key in enumerate(gconf.input_keys)}
+    order = [node for layer in layers for node in layer]
+    for node in order:
+        slots[node] = len(slots)
+    # outputs that no path reaches keep a constant 0.0, like FeedForwardNetwork
+    const_slot = len(slots)
+    num_slots = const_slot + 1
+
+    nodes = []
+    for node in order:
+        ng = genome.nodes[node]
+        links = [[slots[i], genome.connections[(i, o)].weight]
+                 for i, o in connections if o == node and i in slots]
+        nodes.append({
+            'slot': slots[node],
+            'activation': ng.activation,
+            'aggregation': ng.aggregation,
+            'bias': ng.bias,
+            'response': ng.response,
+            'links': links,
+        })
+
+    return {
+        'num_inputs': len(gconf.input_keys),
+        'num_slots': num_slots,
+        'nodes': nodes,
+        'outputs': [slots.get(k, const_slot) for k in gconf.output_keys],
+        'fitness': genome.fitness,
+    }
+
+def save_champion(spec, path=CHAMPION_FILE):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(spec, f)
+
+def load_champion(path=CHAMPION_FILE):
+    """Return a CompiledNet for the saved champion, or None if there isn't one."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return CompiledNet(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        # TypeError also covers neat's InvalidActivationFunction and
+        # InvalidAggregationFunction for unknown function names
+        print("Could not load champion:", e)
+        return None
+
+def bird_inputs(bird, pipes):
+    """
+    Network inputs for a bird: its height and the vertical distances to the
+    next pipe's gap edges. Shared by training and make_pilot so a saved
+    champion always sees what it was trained on.
+    """
+    pipe_ind = 0
+    if len(pipes) > 1 and bird.x > pipes[0].x + pipes[0].PIPE_TOP.get_width():
+        pipe_ind = 1
+    if pipe_ind < len(pipes):
+        return (bird.y,
+                abs(bird.y - pipes[pipe_ind].height),
+                abs(bird.y - pipes[pipe_ind].bottom))
+    return (bird.y, 0.0, 0.0)
+
+def make_pilot(net):
+    """
+    Wrap a net as pilot(bird, pipes) -> bool (jump?), fed the same inputs
+    the birds see during training.
+    """
+    def pilot(bird, pipes):
+        return net.activate(bird_inputs(bird, pipes))[0] > 0.5
+    return pilot
+
 def ai_generation_runner(genomes, config, surface, generation_ref):
     """
     Run one generation. generation_ref is a dict used to control generation/run
     keys: 'gen', 'stop_all', 'running'
+    surface=None runs headless: no frame cap, no event handling, no drawing,
+    and the generation ends as soon as a genome reaches fitness_threshold.
     """
     global GEN
     nets = []
@@ -33,11 +173,19 @@ def ai_generation_runner(genomes, config, surface, generation_ref):
     score = 0
     generation_ref['running'] = True
 
+    headless = surface is None
     while True:
-        clock.tick(45)
+        if headless:
+            if any(g.fitness >= config.fitness_threshold for g in ge):
+                generation_ref['running'] = False
+                return
+            events = []
+        else:
+            clock.tick(45)
+            events = pygame.event.get()
 
         # handle events (allow ESC to stop entire run)
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 generation_ref['stop_all'] = True
                 generation_ref['running'] = False
@@ -55,21 +203,11 @@ def ai_generation_runner(genomes, config, surface, generation_ref):
             generation_ref['running'] = False
             return
 
-        pipe_ind = 0
-        if len(pipes) > 1 and birds[0].x > pipes[0].x + pipes[0].PIPE_TOP.get_width():
-            pipe_ind = 1
-
         # update birds
         for x, bird in enumerate(list(birds)):
             bird.move()
             ge[x].fitness += 0.1
-            if pipe_ind < len(pipes):
-                inputs = (bird.y,
-                          abs(bird.y - pipes[pipe_ind].height),
-                          abs(bird.y - pipes[pipe_ind].bottom))
-            else:
-                inputs = (bird.y, 0.0, 0.0)
-            output = nets[x].activate(inputs)
+            output = nets[x].activate(bird_inputs(bird, pipes))
             if output[0] > 0.5:
                 bird.jump()
 
@@ -111,7 +249,8 @@ def ai_generation_runner(genomes, config, surface, generation_ref):
                 except ValueError:
                     pass
 
-        draw_ai_window(surface, birds, pipes, base, score, generation_ref['gen'])
+        if not headless:
+            draw_ai_window(surface, birds, pipes, base, score, generation_ref['gen'])
 
         if generation_ref.get('stop_all'):
             generation_ref['running'] = False
@@ -121,6 +260,8 @@ def run_ai(config_path, surface, max_gens=50):
     """
     Run NEAT generation-by-generation, allowing ESC to stop cleanly.
     surface: pygame surface to draw to (pygame.display.get_surface()).
+    The best genome is compiled and saved to CHAMPION_FILE if it beats the
+    current champion.
     """
     config = neat.config.Config(neat.DefaultGenome, neat.DefaultReproduction,
                                 neat.DefaultSpeciesSet, neat.DefaultStagnation,
@@ -145,8 +286,46 @@ def run_ai(config_path, surface, max_gens=50):
         if generation_ref['stop_all']:
             break
 
+    if p.best_genome is not None:
+        champion = load_champion()
+        current = champion.spec.get('fitness') if champion is not None else None
+        if current is None or p.best_genome.fitness >= current:
+            save_champion(compile_genome(p.best_genome, config))
+
     # small pause when returning
     if generation_ref['stop_all']:
         surface.blit(pygame.Surface((1,1)), (0,0))
         pygame.display.update()
         pygame.time.delay(200)
+
+def run_headless(config_path, max_gens=50, seed=None):
+    """
+    Train without a window, e.g. for sweeps. Seeds `random` (used by both
+    neat and Pipe) when seed is given so runs are reproducible.
+    Returns a dict: generations, reached (fitness_threshold hit),
+    best_fitness.
+    """
+    if seed is not None:
+        random.seed(seed)
+    config = neat.config.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                config_path)
+    p = neat.Population(config)
+    generation_ref = {'gen': 0, 'stop_all': False, 'running': False}
+
+    def main_wrapper(genomes, config_inner):
+        generation_ref['gen'] += 1
+        ai_generation_runner(genomes, config_inner, None, generation_ref)
+
+    try:
+        p.run(main_wrapper, max_gens)
+    except neat.CompleteExtinctionException:
+        print("Population went extinct:", config_path)
+
+    best = p.best_genome
+    best_fitness = best.fitness if best is not None else None
+    return {
+        'generations': generation_ref['gen'],
+        'reached': best_fitness is not None and best_fitness >= config.fitness_threshold,
+        'best_fitness': best_fitness,
+    }
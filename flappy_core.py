@@ -74,8 +74,11 @@ class Bird:
             if self.tilt > -90:
                 self.tilt -= self.ROT_VEL
 
-    def draw(self, win):
-        self.img_count += 1
+    def draw(self, win, animate=True):
+        # animate=False redraws the current wing frame without advancing it,
+        # for loops that render more often than the simulation ticks
+        if animate:
+            self.img_count += 1
         if self.img_count < self.ANIMATION_TIME:
             self.img = self.IMGS[0]
         elif self.img_count < self.ANIMATION_TIME * 2:
@@ -158,14 +161,17 @@ class Base:
         win.blit(self.IMG, (self.x2, self.y))
 
 # Drawing helpers for manual and AI modes
-def draw_game_window(win, bird, pipes, base, score):
+def draw_game_window(win, bird, pipes, base, score, animate=True, overlay=None):
     win.blit(BG_IMG, (0, 0))
     for pipe in pipes:
         pipe.draw(win)
     score_text = STAT_FONT.render(f"Score: {score}", True, (255, 255, 255))
     win.blit(score_text, (WIN_WIDTH - 10 - score_text.get_width(), 10))
     base.draw(win)
-    bird.draw(win)
+    bird.draw(win, animate)
+    if overlay:
+        overlay_text = STAT_FONT.render(overlay, True, (255, 255, 255))
+        win.blit(overlay_text, (10, WIN_HEIGHT - 10 - overlay_text.get_height()))
     pygame.display.update()
 
 def draw_ai_window(win, birds, pipes, base, score, gen):
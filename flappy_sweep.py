@@ -0,0 +1,187 @@
+# flappy_sweep.py
+# Headless hyperparameter sweep over config-feedforward.txt.
+# Builds config variants from a grid (or a random sample of it), trains each
+# one with run_headless in a process pool, and ranks the variants by
+# generations-to-threshold and wall time.
+#
+# Example:
+#   python flappy_sweep.py --set pop_size=10,20,50 \
+#       --set compatibility_threshold=2.5,3.0 --seeds 1,2,3 --jobs 4
+# Keys can be bare (resolved to the only section that has them) or
+# Section.key, e.g. DefaultGenome.weight_mutate_rate=0.5,0.8.
+
+import os
+# workers never open a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import configparser
+import csv
+import itertools
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from flappy_ai import run_headless
+
+BASE_DIR = os.path.dirname(__file__)
+DEFAULT_CONFIG = os.path.join(BASE_DIR, "config-feedforward.txt")
+
+def read_config(path):
+    # neat's own config files are case sensitive
+    parser = configparser.ConfigParser()
+    parser.optionxform = str
+    with open(path, "r", encoding="utf-8") as f:
+        parser.read_file(f)
+    return parser
+
+def parse_param(spec, parser):
+    """
+    Parse 'key=v1,v2' or 'Section.key=v1,v2' into (section, key, [values]).
+    Raises ValueError for unknown or ambiguous keys.
+    """
+    if "=" not in spec:
+        raise ValueError(f"Expected key=v1,v2,...: {spec}")
+    name, values = spec.split("=", 1)
+    values = [v.strip() for v in values.split(",") if v.strip()]
+    if not values:
+        raise ValueError(f"No values given for {name}")
+    if "." in name:
+        section, key = name.split(".", 1)
+        if not parser.has_option(section, key):
+            raise ValueError(f"Unknown config key: {name}")
+        return section, key, values
+    sections = [s for s in parser.sections() if parser.has_option(s, name)]
+    if len(sections) != 1:
+        raise ValueError(f"Key {name} matches sections {sections}; use Section.key")
+    return sections[0], name, values
+
+def build_variants(params, sample=None, sample_seed=0):
+    """
+    Cartesian product of the parameter values as a list of
+    {(section, key): value} dicts; sample=N picks N of them at random.
+    """
+    keys = [(section, key) for section, key, _ in params]
+    grid = [dict(zip(keys, combo)) for combo in itertools.product(*(v for _, _, v in params))]
+    if sample is not None and sample < len(grid):
+        grid = random.Random(sample_seed).sample(grid, sample)
+    return grid
+
+def write_variant(parser, overrides, path):
+    variant = configparser.ConfigParser()
+    variant.optionxform = str
+    variant.read_dict(parser)
+    for (section, key), value in overrides.items():
+        variant.set(section, key, value)
+    with open(path, "w", encoding="utf-8") as f:
+        variant.write(f)
+
+def run_job(name, config_path, seed, max_gens):
+    """Worker entry point: one headless training run."""
+    start = time.perf_counter()
+    result = run_headless(config_path, max_gens=max_gens, seed=seed)
+    result['wall_time'] = time.perf_counter() - start
+    result['variant'] = name
+    result['seed'] = seed
+    return result
+
+def rank_variants(variants, runs):
+    """
+    One row per variant: runs that reached the threshold, mean generations
+    and mean wall time over those runs (all runs if none did). Sorted by most
+    solved, then fewest generations, then fastest.
+    """
+    rows = []
+    for name, overrides in variants.items():
+        mine = [r for r in runs if r['variant'] == name]
+        solved = [r for r in mine if r['reached']]
+        pool = solved or mine
+        rows.append({
+            'variant': name,
+            'params': " ".join(f"{k}={v}" for (_, k), v in overrides.items()),
+            'solved': f"{len(solved)}/{len(mine)}",
+            'mean_gens': sum(r['generations'] for r in pool) / len(pool) if pool else None,
+            'mean_wall': sum(r['wall_time'] for r in pool) / len(pool) if pool else None,
+            '_solved': len(solved),
+        })
+    rows.sort(key=lambda r: (-r['_solved'],
+                             r['mean_gens'] if r['mean_gens'] is not None else float("inf"),
+                             r['mean_wall'] if r['mean_wall'] is not None else float("inf")))
+    for row in rows:
+        del row['_solved']
+    return rows
+
+def write_csv(path, rows, fields):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def print_table(rows):
+    print(f"{'rank':>4}  {'variant':<12} {'solved':>6} {'gens':>6} {'wall s':>8}  params")
+    for rank, r in enumerate(rows, start=1):
+        gens = "-" if r['mean_gens'] is None else f"{r['mean_gens']:.1f}"
+        wall = "-" if r['mean_wall'] is None else f"{r['mean_wall']:.1f}"
+        print(f"{rank:>4}  {r['variant']:<12} {r['solved']:>6} {gens:>6} {wall:>8}  {r['params']}")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Headless NEAT hyperparameter sweep.")
+    ap.add_argument("--config", default=DEFAULT_CONFIG, help="base NEAT config")
+    ap.add_argument("--set", dest="params", action="append", default=[],
+                    metavar="KEY=V1,V2", help="values to sweep for a config key (repeatable)")
+    ap.add_argument("--random", type=int, default=None, metavar="N",
+                    help="random search: run N variants sampled from the grid")
+    ap.add_argument("--seeds", default="1", help="comma-separated seeds run for every variant")
+    ap.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 2) - 1),
+                    help="max concurrent training processes (CPU budget)")
+    ap.add_argument("--max-gens", type=int, default=50)
+    ap.add_argument("--out", default="sweep_out", help="directory for variant configs and results")
+    args = ap.parse_args(argv)
+
+    parser = read_config(args.config)
+    try:
+        params = [parse_param(spec, parser) for spec in args.params]
+        seeds = [int(s) for s in args.seeds.split(",") if s.strip()]
+    except ValueError as e:
+        ap.error(str(e))
+
+    os.makedirs(args.out, exist_ok=True)
+    variants = {}
+    for i, overrides in enumerate(build_variants(params, args.random)):
+        name = f"variant_{i:03d}"
+        write_variant(parser, overrides, os.path.join(args.out, name + ".txt"))
+        variants[name] = overrides
+
+    jobs = [(name, os.path.join(args.out, name + ".txt"), seed)
+            for name in variants for seed in seeds]
+    print(f"Running {len(jobs)} jobs ({len(variants)} variants x {len(seeds)} seeds) "
+          f"on {args.jobs} processes")
+
+    runs = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(run_job, name, path, seed, args.max_gens)
+                   for name, path, seed in jobs]
+        for fut in as_completed(futures):
+            try:
+                r = fut.result()
+            except Exception as e:
+                print("Job failed:", e)
+                continue
+            runs.append(r)
+            print(f"{r['variant']} seed={r['seed']}: gens={r['generations']} "
+                  f"reached={r['reached']} wall={r['wall_time']:.1f}s")
+
+    runs.sort(key=lambda r: (r['variant'], r['seed']))
+    write_csv(os.path.join(args.out, "runs.csv"), runs,
+              ['variant', 'seed', 'generations', 'reached', 'best_fitness', 'wall_time'])
+    ranking = rank_variants(variants, runs)
+    write_csv(os.path.join(args.out, "results.csv"), ranking,
+              ['variant', 'params', 'solved', 'mean_gens', 'mean_wall'])
+    print_table(ranking)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# flappy_timing.py
+# Frame pacing and latency/frame-time statistics for the game loops.
+# Exposes FramePacer, FrameStats and percentile().
+
+import math
+import time
+from collections import deque
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of an iterable of numbers (pct in 0..100):
+    the smallest sample with at least pct% of the samples <= it.
+    Returns None when there are no samples.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = math.ceil(pct / 100.0 * len(ordered))
+    return ordered[max(1, min(rank, len(ordered))) - 1]
+
+def _fmt_ms(v):
+    return "-" if v is None else f"{v:.1f}"
+
+class FramePacer:
+    """
+    Paces a loop to a target rate against perf_counter deadlines.
+    Sleep on something else (e.g. the event queue) for time_left() and
+    call advance() when presenting a frame.
+    """
+
+    def __init__(self, fps):
+        self.period = 1.0 / fps
+        self.deadline = time.perf_counter() + self.period
+
+    def time_left(self):
+        """Seconds until the next frame is due (0 if it already is)."""
+        return max(0.0, self.deadline - time.perf_counter())
+
+    def advance(self):
+        """Mark a frame as presented and schedule the next; returns now."""
+        now = time.perf_counter()
+        if now < self.deadline:
+            # presented early (e.g. to show input right away): re-phase
+            self.deadline = now + self.period
+            return now
+        self.deadline += self.period
+        # fell more than a frame behind (window drag, GC, ...): resync
+        # instead of rushing through a burst of catch-up frames
+        if now > self.deadline:
+            self.deadline = now + self.period
+        return now
+
+class FrameStats:
+    """
+    Rolling window of frame times and input latencies (seconds), where a
+    latency runs from polling a press to presenting the frame that shows it.
+    """
+
+    def __init__(self, window=600):
+        self.frame_times = deque(maxlen=window)
+        self.latencies = deque(maxlen=window)
+        self._last_frame = None
+
+    def mark_frame(self, now=None):
+        now = time.perf_counter() if now is None else now
+        if self._last_frame is not None:
+            self.frame_times.append(now - self._last_frame)
+        self._last_frame = now
+
+    def record_latency(self, seconds):
+        self.latencies.append(seconds)
+
+    def summary(self):
+        """Dict of p50/p95/p99 frame times and p50/p99/max latency in ms."""
+        def ms(v):
+            return None if v is None else v * 1000.0
+        return {
+            'frame_p50': ms(percentile(self.frame_times, 50)),
+            'frame_p95': ms(percentile(self.frame_times, 95)),
+            'frame_p99': ms(percentile(self.frame_times, 99)),
+            'latency_p50': ms(percentile(self.latencies, 50)),
+            'latency_p99': ms(percentile(self.latencies, 99)),
+            'latency_max': ms(max(self.latencies) if self.latencies else None),
+        }
+
+    def format_overlay(self):
+        """Short one-liner that fits across the game window."""
+        s = self.summary()
+        return f"p99 {_fmt_ms(s['frame_p99'])}ms  lag {_fmt_ms(s['latency_p50'])}ms"
+
+    def format_summary(self):
+        fmt = _fmt_ms
+        s = self.summary()
+        return (f"frame p50/p95/p99 {fmt(s['frame_p50'])}/{fmt(s['frame_p95'])}/"
+                f"{fmt(s['frame_p99'])} ms | press->frame p50/p99 "
+                f"{fmt(s['latency_p50'])}/{fmt(s['latency_p99'])} ms")
@@ -20,7 +20,8 @@ from flappy_core import (
     WIN_WIDTH, WIN_HEIGHT, BG_IMG, STAT_FONT,
     Bird, Pipe, Base, draw_game_window, draw_ai_window
 )
-from flappy_ai import run_ai
+from flappy_ai import run_ai, load_champion, make_pilot
+from flappy_timing import FramePacer, FrameStats
 import errno
 
 print(os.getenv("DB_PASSWORD")
@@ -32,6 +33,8 @@ pygame.font.init()
 # Window setup
 WIN = pygame.display.set_mode((WIN_WIDTH, WIN_HEIGHT))
 pygame.display.set_caption("Flappy Bird - Player & AI Modes")
+# nothing uses the mouse; don't wake the idle menus on every motion event
+pygame.event.set_blocked(pygame.MOUSEMOTION)
 
 # fonts and colors for menu
 TITLE_FONT = pygame.font.SysFont("comicsans", 64)
@@ -43,6 +46,25 @@ GREY = (180, 180, 180)
 HIGHLIGHT = (30, 144, 255)
 GOLD = (212, 175, 55)
 
+# manual mode timing: the simulation always ticks at SIM_TICK_RATE (physics
+# constants are per tick). Frames are presented at DISPLAY_FPS; rates above the
+# sim rate extrapolate motion between ticks but cost a full redraw per frame,
+# so they are opt-in.
+SIM_TICK_RATE = 30
+MAX_DISPLAY_FPS = 240
+MAX_TICKS_PER_FRAME = 5
+SHOW_FRAME_STATS = os.getenv("SHOW_FRAME_STATS", "0") == "1"
+
+def display_fps_from_env(default=SIM_TICK_RATE):
+    try:
+        fps = int(os.getenv("DISPLAY_FPS", default))
+    except ValueError:
+        print("Invalid DISPLAY_FPS; using", default)
+        fps = default
+    return max(SIM_TICK_RATE, min(fps, MAX_DISPLAY_FPS))
+
+DISPLAY_FPS = display_fps_from_env()
+
 # highscores file
 HIGHSCORE_FILE = "highscores.txt"
 MAX_HIGHS = 10
@@ -158,26 +180,95 @@ def save_result_to_db(name, score):
         print("Failed to save result to DB:", e)
         return False
 
-# --- Input gamertag inside window ---
-def draw_text_center(win, text, font, color, y):
+# --- Event-driven UI helpers ---
+# Menu-style screens sleep in wait_events() and only push changed rects to
+# the display; a full redraw happens on entry and when the window is exposed.
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+CURSOR_BLINK_MS = 667
+
+def wait_events(timeout_ms=None):
+    """
+    Sleep until at least one event arrives (or timeout_ms passes), then drain
+    the rest of the queue. Returns a possibly empty list of events.
+    """
+    if timeout_ms is None:
+        first = pygame.event.wait()
+    else:
+        first = pygame.event.wait(max(1, int(timeout_ms)))
+    events = [] if first.type == pygame.NOEVENT else [first]
+    events.extend(pygame.event.get())
+    return events
+
+def render_text_center(text, font, color, y):
+    """Pre-render a centred line; returns (surface, rect) ready to blit."""
     surf = font.render(text, True, color)
-    win.blit(surf, (WIN_WIDTH//2 - surf.get_width()//2, y))
+    return surf, surf.get_rect(midtop=(WIN_WIDTH//2, y))
+
+def draw_static(win, layout):
+    """Full redraw of a background plus pre-rendered (surface, rect) pairs."""
+    win.blit(BG_IMG, (0,0))
+    for surf, rect in layout:
+        win.blit(surf, rect)
+    pygame.display.update()
+
+def static_screen(win, layout, exit_keys):
+    """Show a screen that never changes until a key in exit_keys or QUIT."""
+    draw_static(win, layout)
+    while True:
+        for event in wait_events():
+            if event.type == pygame.QUIT:
+                return
+            if event.type == pygame.KEYDOWN and event.key in exit_keys:
+                return
+            if event.type in REDRAW_EVENTS:
+                draw_static(win, layout)
 
+def medal_for(idx):
+    return {1: "🥇 ", 2: "🥈 ", 3: "🥉 "}.get(idx, "")
+
+# --- Input gamertag inside window ---
 def input_gamertag(win):
     gamertag = ""
-    clock = pygame.time.Clock()
     prompt = "Enter gamertag (Enter to confirm, ESC to cancel)"
     blink = True
-    blink_timer = 0
 
-    while True:
-        clock.tick(30)
-        blink_timer = (blink_timer + 1) % 40
-        blink = blink_timer < 20
+    box_w, box_h = 360, 50
+    box_x = WIN_WIDTH//2 - box_w//2
+    box_y = 240
+    box_rect = pygame.Rect(box_x, box_y, box_w, box_h)
+    layout = [
+        render_text_center("Play Yourself", BIG_FONT, WHITE, 100),
+        render_text_center(prompt, SMALL_FONT, GREY, 170),
+        render_text_center("(max 16 characters)", SMALL_FONT, GREY, box_y + box_h + 12),
+        render_text_center("ESC to cancel", SMALL_FONT, GREY, WIN_HEIGHT - 40),
+    ]
+    name_surf = STAT_FONT.render(gamertag, True, WHITE)
+
+    def draw_box():
+        pygame.draw.rect(win, (0, 0, 0), box_rect)
+        pygame.draw.rect(win, WHITE, box_rect, 2)
+        win.blit(name_surf, (box_x + 10, box_y + 10))
+        if blink:
+            cur_x = box_x + 10 + name_surf.get_width() + 2
+            pygame.draw.rect(win, WHITE, (cur_x, box_y + 12, 2, box_h - 24))
 
-        for event in pygame.event.get():
+    redraw_all = True
+    next_blink = pygame.time.get_ticks() + CURSOR_BLINK_MS
+    while True:
+        if redraw_all:
+            win.blit(BG_IMG, (0,0))
+            for surf, rect in layout:
+                win.blit(surf, rect)
+            draw_box()
+            pygame.display.update()
+            redraw_all = False
+
+        dirty = False
+        for event in wait_events(next_blink - pygame.time.get_ticks()):
             if event.type == pygame.QUIT:
                 return None
+            if event.type in REDRAW_EVENTS:
+                redraw_all = True
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return None
@@ -187,74 +278,160 @@ def input_gamertag(win):
                     return gamertag.strip()[:16]
                 elif event.key == pygame.K_BACKSPACE:
                     gamertag = gamertag[:-1]
+                    name_surf = STAT_FONT.render(gamertag, True, WHITE)
+                    dirty = True
                 else:
                     if len(gamertag) < 16 and event.unicode.isprintable():
                         gamertag += event.unicode
+                        name_surf = STAT_FONT.render(gamertag, True, WHITE)
+                        dirty = True
 
-        win.blit(BG_IMG, (0,0))
-        draw_text_center(win, "Play Yourself", BIG_FONT, WHITE, 100)
-        draw_text_center(win, prompt, SMALL_FONT, GREY, 170)
-
-        box_w, box_h = 360, 50
-        box_x = WIN_WIDTH//2 - box_w//2
-        box_y = 240
-        pygame.draw.rect(win, (0, 0, 0), (box_x, box_y, box_w, box_h))
-        pygame.draw.rect(win, WHITE, (box_x, box_y, box_w, box_h), 2)
-        name_surf = STAT_FONT.render(gamertag, True, WHITE)
-        win.blit(name_surf, (box_x + 10, box_y + 10))
-        if blink:
-            cur_x = box_x + 10 + name_surf.get_width() + 2
-            pygame.draw.rect(win, WHITE, (cur_x, box_y + 12, 2, box_h - 24))
-        draw_text_center(win, "(max 16 characters)", SMALL_FONT, GREY, box_y + box_h + 12)
-        draw_text_center(win, "ESC to cancel", SMALL_FONT, GREY, WIN_HEIGHT - 40)
-        pygame.display.update()
+        now = pygame.time.get_ticks()
+        if now >= next_blink:
+            blink = not blink
+            next_blink = now + CURSOR_BLINK_MS
+            dirty = True
+
+        if dirty and not redraw_all:
+            draw_box()
+            pygame.display.update(box_rect)
 
 # --- Manual mode ---
-def manual_mode(win, gamertag):
+def draw_extrapolated(win, bird, pipes, base, score, prev_y, alpha, animate, overlay):
+    """
+    Draw the game alpha ticks (0..1) past the last simulated tick so frames
+    between ticks still move. Pipes and base scroll at a constant speed; the
+    bird continues its last per-tick displacement (cur - prev_y). Positions
+    are restored afterwards so the simulation never sees them.
+    """
+    saved = (bird.y, [pipe.x for pipe in pipes], base.x1, base.x2)
+    bird.y += (bird.y - prev_y) * alpha
+    for pipe in pipes:
+        pipe.x -= pipe.VEL * alpha
+    base.x1 -= base.VEL * alpha
+    base.x2 -= base.VEL * alpha
+    try:
+        draw_game_window(win, bird, pipes, base, score, animate=animate, overlay=overlay)
+    finally:
+        bird.y, pipe_xs, base.x1, base.x2 = saved
+        for pipe, x in zip(pipes, pipe_xs):
+            pipe.x = x
+
+def play_round(win, pilot=None):
+    """
+    Play one round and return the score, or None if the player quit (ESC).
+    Fixed-step simulation at SIM_TICK_RATE, frames presented at DISPLAY_FPS.
+    Between frames the loop sleeps on the event queue, so a SPACE press is
+    picked up as soon as it arrives; it starts a simulation tick right away
+    and the frame showing the jump is presented immediately.
+    F3 toggles the frame-time / input-latency overlay.
+    pilot: optional pilot(bird, pipes) -> bool (see flappy_ai.make_pilot)
+    that flies instead of the keyboard; any key then ends the round. Piloted
+    rounds present at SIM_TICK_RATE since there is no input to wait for.
+    """
     bird = Bird(230, 350)
     base = Base(730)
     pipes = [Pipe(600)]
-    clock = pygame.time.Clock()
     score = 0
     run = True
 
+    pacer = FramePacer(SIM_TICK_RATE if pilot else DISPLAY_FPS)
+    stats = FrameStats()
+    show_stats = SHOW_FRAME_STATS
+    tick = 1.0 / SIM_TICK_RATE
+    # pygame events carry no timestamp, so presses are timed from the poll;
+    # the loop is blocked in the event queue, so that is as soon as SDL
+    # delivers the key
+    pending_jump = None  # poll time of a press not yet simulated
+    shown_jump = None    # poll time of a simulated press not yet presented
+    accumulator = 0.0
+    last_time = time.perf_counter()
+    prev_y = bird.y
+    ticked = False  # a tick ran since the last presented frame
+
     while run:
-        clock.tick(30)
-        for event in pygame.event.get():
+        for event in wait_events(pacer.time_left() * 1000):
             if event.type == pygame.QUIT:
                 return None
             if event.type == pygame.KEYDOWN:
+                if pilot is not None:
+                    return None
                 if event.key == pygame.K_SPACE:
-                    bird.jump()
+                    if pending_jump is None:
+                        pending_jump = time.perf_counter()
+                elif event.key == pygame.K_F3:
+                    show_stats = not show_stats
                 elif event.key == pygame.K_ESCAPE:
                     return None
 
-        bird.move()
-        base.move()
-        add_pipe = False
-        rem = []
-
-        for pipe in pipes:
-            pipe.move()
-            if pipe.collide(bird):
+        now = time.perf_counter()
+        # clamp so a stall (window drag etc.) doesn't fast-forward the game
+        accumulator = min(accumulator + now - last_time, tick * MAX_TICKS_PER_FRAME)
+        last_time = now
+
+        # A press runs its tick now instead of at the next scheduled one. The
+        # tick is borrowed from the schedule (accumulator goes negative, at
+        # most one tick at a time) so the game speed is unchanged; a second
+        # press inside the same tick waits for the regular tick.
+        while run and (accumulator >= tick or (pending_jump is not None and accumulator >= 0)):
+            accumulator -= tick
+            ticked = True
+            prev_y = bird.y
+            if pending_jump is not None:
+                bird.jump()
+                shown_jump = pending_jump
+                pending_jump = None
+
+            bird.move()
+            # same order as training: decide after the bird has moved
+            if pilot is not None and pilot(bird, pipes):
+                bird.jump()
+            base.move()
+            add_pipe = False
+            rem = []
+
+            for pipe in pipes:
+                pipe.move()
+                if pipe.collide(bird):
+                    run = False
+                if not pipe.passed and pipe.x < bird.x:
+                    pipe.passed = True
+                    add_pipe = True
+                if pipe.x + pipe.PIPE_TOP.get_width() < 0:
+                    rem.append(pipe)
+
+            if add_pipe:
+                score += 1
+                pipes.append(Pipe(WIN_WIDTH))
+            for r in rem:
+                if r in pipes:
+                    pipes.remove(r)
+
+            if bird.y + bird.img.get_height() >= 730 or bird.y < 0:
                 run = False
-            if not pipe.passed and pipe.x < bird.x:
-                pipe.passed = True
-                add_pipe = True
-            if pipe.x + pipe.PIPE_TOP.get_width() < 0:
-                rem.append(pipe)
-
-        if add_pipe:
-            score += 1
-            pipes.append(Pipe(WIN_WIDTH))
-        for r in rem:
-            if r in pipes:
-                pipes.remove(r)
 
-        if bird.y + bird.img.get_height() >= 730 or bird.y < 0:
-            run = False
+        # present when a frame is due, straight away to show a jump, and
+        # always for the tick that ended the round
+        if run and pacer.time_left() > 0 and shown_jump is None:
+            continue
+        overlay = stats.format_overlay() if show_stats else None
+        # nothing moves after the final tick, so show it exactly
+        alpha = max(0.0, accumulator) / tick if run else 0.0
+        draw_extrapolated(win, bird, pipes, base, score, prev_y, alpha, ticked, overlay)
+        ticked = False
+        stats.mark_frame(pacer.advance())
+        if shown_jump is not None:
+            stats.record_latency(time.perf_counter() - shown_jump)
+            shown_jump = None
+
+    if pilot is None and SHOW_FRAME_STATS:
+        print("Frame stats:", stats.format_summary())
+    return score
 
-        draw_game_window(win, bird, pipes, base, score)
+def manual_mode(win, gamertag):
+    score = play_round(win)
+    if score is None:
+        return None
 
     # Game over: save highs locally and attempt DB save
     highs = load_highscores()
@@ -267,148 +444,142 @@ def manual_mode(win, gamertag):
     saved_db = save_result_to_db(gamertag, score)
 
     # Show game over screen
-    clock = pygame.time.Clock()
-    while True:
-        clock.tick(30)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return None
-            if event.type == pygame.KEYDOWN and (event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE):
-                return None
-
-        win.blit(BG_IMG, (0,0))
-        draw_text_center(win, "Game Over", TITLE_FONT, WHITE, 100)
-        draw_text_center(win, f"{gamertag} scored: {score}", BIG_FONT, GREY, 200)
-        if is_high:
-            draw_text_center(win, "NEW TOP 10! Saved locally.", SMALL_FONT, GOLD, 280)
-        else:
-            draw_text_center(win, "Press Enter or ESC to return to title", SMALL_FONT, GREY, 280)
-
-        draw_text_center(win, f"DB saved: {'Yes' if saved_db else 'No'}", SMALL_FONT, GREY, 320)
-
+    if is_high:
+        hint = render_text_center("NEW TOP 10! Saved locally.", SMALL_FONT, GOLD, 280)
+    else:
+        hint = render_text_center("Press Enter or ESC to return to title", SMALL_FONT, GREY, 280)
+    layout = [
+        render_text_center("Game Over", TITLE_FONT, WHITE, 100),
+        render_text_center(f"{gamertag} scored: {score}", BIG_FONT, GREY, 200),
+        hint,
+        render_text_center(f"DB saved: {'Yes' if saved_db else 'No'}", SMALL_FONT, GREY, 320),
         # preview top 5
-        draw_text_center(win, "Top highs (preview):", SMALL_FONT, WHITE, 360)
-        y = 400
-        preview = highs[:5]
-        for idx, (n, s) in enumerate(preview, start=1):
-            medal = ""
-            if idx == 1:
-                medal = "🥇 "
-            elif idx == 2:
-                medal = "🥈 "
-            elif idx == 3:
-                medal = "🥉 "
-            surf = STAT_FONT.render(f"{idx}. {medal}{n} - {s}", True, WHITE)
-            win.blit(surf, (WIN_WIDTH//2 - surf.get_width()//2, y))
-            y += 36
-
+        render_text_center("Top highs (preview):", SMALL_FONT, WHITE, 360),
+    ]
+    y = 400
+    for idx, (n, s) in enumerate(highs[:5], start=1):
+        layout.append(render_text_center(f"{idx}. {medal_for(idx)}{n} - {s}", STAT_FONT, WHITE, y))
+        y += 36
+
+    static_screen(win, layout, (pygame.K_RETURN, pygame.K_ESCAPE))
+    return None
+
+# --- AI demo (attract mode) ---
+def ai_demo_mode(win):
+    """
+    Let the saved champion play round after round until any key is pressed.
+    """
+    net = load_champion()
+    if net is None:
+        win.blit(BG_IMG, (0,0))
+        msg = STAT_FONT.render("No champion yet - run AI Mode first", True, WHITE)
+        win.blit(msg, (WIN_WIDTH//2 - msg.get_width()//2, WIN_HEIGHT//2))
         pygame.display.update()
+        pygame.time.delay(1000)
+        return
+    pilot = make_pilot(net)
+    while play_round(win, pilot) is not None:
+        pygame.time.delay(500)
 
 # --- Highscores screen ---
 def highscores_screen(win):
     ensure_highscore_file()
-    clock = pygame.time.Clock()
-    while True:
-        clock.tick(30)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                return
+    layout = [render_text_center("TOP 10 HIGHSCORES", TITLE_FONT, WHITE, 60)]
+    y = 150
+    for idx, (name, score) in enumerate(load_highscores(), start=1):
+        line = f"{idx}. {medal_for(idx)}{name} - {score}"
+        layout.append(render_text_center(line, STAT_FONT, WHITE, y))
+        y += 40
+    static_screen(win, layout, (pygame.K_ESCAPE,))
 
-        win.blit(BG_IMG, (0,0))
-        draw_text_center(win, "TOP 10 HIGHSCORES", TITLE_FONT, WHITE, 60)
-        highs = load_highscores()
-        y = 150
-        for idx, (name, score) in enumerate(highs, start=1):
-            color = WHITE
-            medal = ""
-            if idx == 1:
-                medal = "🥇 "
-            elif idx == 2:
-                medal = "🥈 "
-            elif idx == 3:
-                medal = "🥉 "
-            line = f"{idx}. {medal}{name} - {score}"
-            surf = STAT_FONT.render(line, True, color)
-            win.blit(surf, (WIN_WIDTH//2 - surf.get_width()//2, y))
-            y += 40
+# --- Title/menu ---
+def start_ai_mode():
+    local_dir = os.path.dirname(__file__)
+    config_path = os.path.join(local_dir, "config-feedforward.txt")
+    if not os.path.exists(config_path):
+        WIN.blit(BG_IMG, (0,0))
+        msg = STAT_FONT.render("Missing config-feedforward.txt", True, WHITE)
+        WIN.blit(msg, (WIN_WIDTH//2 - msg.get_width()//2, WIN_HEIGHT//2))
         pygame.display.update()
+        pygame.time.delay(1000)
+    else:
+        # run NEAT; this function will handle ESC to return cleanly
+        surface = pygame.display.get_surface()
+        run_ai(config_path, surface, max_gens=50)
+
+def run_menu_choice(choice):
+    if choice == "Play Yourself":
+        name = input_gamertag(WIN)
+        if name:
+            manual_mode(WIN, name)
+    elif choice == "AI Mode":
+        start_ai_mode()
+    elif choice == "AI Demo":
+        ai_demo_mode(WIN)
+    elif choice == "Top 10":
+        highscores_screen(WIN)
+    elif choice == "Quit":
+        pygame.quit(); sys.exit()
 
-# --- Title/menu ---
 def title_screen():
     ensure_highscore_file()
     ensure_results_table()  # try to create table (if DB configured)
-    clock = pygame.time.Clock()
-    menu_items = ["Play Yourself", "AI Mode", "Top 10", "Quit"]
+    menu_items = ["Play Yourself", "AI Mode", "Top 10", "AI Demo", "Quit"]
+    quick_keys = {pygame.K_1: "Play Yourself", pygame.K_2: "AI Mode",
+                  pygame.K_3: "Top 10", pygame.K_4: "AI Demo"}
     selected = 0
 
+    # pre-render every line once: each menu item in both plain and
+    # highlighted form, so moving the selection is two blits
+    layout = [
+        render_text_center("Flappy Bird", TITLE_FONT, WHITE, 120),
+        render_text_center("Use Up/Down or W/S, Enter to select. 1-4 quick keys supported.", SMALL_FONT, GREY, WIN_HEIGHT - 40),
+    ]
+    start_y = 260
+    gap = 80
+    item_lines = []
+    for idx, item in enumerate(menu_items):
+        plain = render_text_center(f"  {item}", BIG_FONT, WHITE, start_y + idx * gap)
+        active = render_text_center(f"> {item}", BIG_FONT, HIGHLIGHT, start_y + idx * gap)
+        item_lines.append((plain, active, plain[1].union(active[1])))
+
+    def draw_item(idx):
+        plain, active, area = item_lines[idx]
+        surf, rect = active if idx == selected else plain
+        WIN.blit(BG_IMG, area.topleft, area)
+        WIN.blit(surf, rect)
+        return area
+
+    redraw_all = True
     while True:
-        clock.tick(30)
-        for event in pygame.event.get():
+        if redraw_all:
+            draw_static(WIN, layout + [item[1] if i == selected else item[0]
+                                       for i, item in enumerate(item_lines)])
+            redraw_all = False
+
+        dirty = []
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
+            if event.type in REDRAW_EVENTS:
+                redraw_all = True
             if event.type == pygame.KEYDOWN:
-                if event.key in (pygame.K_DOWN, pygame.K_s):
-                    selected = (selected + 1) % len(menu_items)
-                elif event.key in (pygame.K_UP, pygame.K_w):
-                    selected = (selected - 1) % len(menu_items)
+                if event.key in (pygame.K_DOWN, pygame.K_s, pygame.K_UP, pygame.K_w):
+                    step = 1 if event.key in (pygame.K_DOWN, pygame.K_s) else -1
+                    previous = selected
+                    selected = (selected + step) % len(menu_items)
+                    dirty += [draw_item(previous), draw_item(selected)]
                 elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                    choice = menu_items[selected]
-                    if choice == "Play Yourself":
-                        name = input_gamertag(WIN)
-                        if name:
-                            manual_mode(WIN, name)
-                    elif choice == "AI Mode":
-                        local_dir = os.path.dirname(__file__)
-                        config_path = os.path.join(local_dir, "config-feedforward.txt")
-                        if not os.path.exists(config_path):
-                            WIN.blit(BG_IMG, (0,0))
-                            msg = STAT_FONT.render("Missing config-feedforward.txt", True, WHITE)
-                            WIN.blit(msg, (WIN_WIDTH//2 - msg.get_width()//2, WIN_HEIGHT//2))
-                            pygame.display.update()
-                            pygame.time.delay(1000)
-                        else:
-                            # run NEAT; this function will handle ESC to return cleanly
-                            surface = pygame.display.get_surface()
-                            run_ai(config_path, surface, max_gens=50)
-                    elif choice == "Top 10":
-                        highscores_screen(WIN)
-                    elif choice == "Quit":
-                        pygame.quit(); sys.exit()
-                elif event.key == pygame.K_1:
-                    name = input_gamertag(WIN)
-                    if name:
-                        manual_mode(WIN, name)
-                elif event.key == pygame.K_2:
-                    local_dir = os.path.dirname(__file__)
-                    config_path = os.path.join(local_dir, "config-feedforward.txt")
-                    if not os.path.exists(config_path):
-                        WIN.blit(BG_IMG, (0,0))
-                        msg = STAT_FONT.render("Missing config-feedforward.txt", True, WHITE)
-                        WIN.blit(msg, (WIN_WIDTH//2 - msg.get_width()//2, WIN_HEIGHT//2))
-                        pygame.display.update()
-                        pygame.time.delay(1000)
-                    else:
-                        surface = pygame.display.get_surface()
-                        run_ai(config_path, surface, max_gens=50)
-                elif event.key == pygame.K_3:
-                    highscores_screen(WIN)
+                    run_menu_choice(menu_items[selected])
+                    redraw_all = True
+                elif event.key in quick_keys:
+                    run_menu_choice(quick_keys[event.key])
+                    redraw_all = True
                 elif event.key == pygame.K_ESCAPE:
                     pygame.quit(); sys.exit()
 
-        # draw menu
-        WIN.blit(BG_IMG, (0,0))
-        draw_text_center(WIN, "Flappy Bird", TITLE_FONT, WHITE, 120)
-        start_y = 260
-        gap = 80
-        for idx, item in enumerate(menu_items):
-            prefix = "> " if idx == selected else "  "
-            color = HIGHLIGHT if idx == selected else WHITE
-            surf = BIG_FONT.render(f"{prefix}{item}", True, color)
-            WIN.blit(surf, (WIN_WIDTH//2 - surf.get_width()//2, start_y + idx * gap))
-        draw_text_center(WIN, "Use Up/Down or W/S, Enter to select. 1/2/3 quick keys supported.", SMALL_FONT, GREY, WIN_HEIGHT - 40)
-        pygame.display.update()
+        if dirty and not redraw_all:
+            pygame.display.update(dirty)
 
 if __name__ == "__main__":
     title_screen()